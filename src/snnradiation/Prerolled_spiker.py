@@ -0,0 +1,50 @@
+"""Contains a random spiker of which the spikes are drawn before the
+simulation starts."""
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+from simsnn.core.nodes import RandomSpiker
+
+
+# pylint: disable=R0903
+# pylint: disable=R0913
+class Prerolled_spiker(RandomSpiker):
+    """Random spiker that reads its spikes from a pre-rolled, bit-packed
+    array, instead of drawing a random number at each timestep.
+
+    The spikes of the sim_duration are drawn from the random generator at
+    once, with the same values a RandomSpiker would draw one per timestep.
+    Once the pre-rolled spikes are used up, it continues to draw its spikes
+    from that random generator, like a RandomSpiker does.
+    """
+
+    def __init__(
+        self,
+        *,
+        amplitude: float,
+        p: float,
+        rng: np.random.Generator,
+        sim_duration: int,
+        ID: Optional[str] = None,
+    ) -> None:
+        super().__init__(p=p, amplitude=amplitude, rng=rng, ID=ID)
+        # Spike t is stored in bit t % 8 of byte t // 8.
+        self.packed_spikes: npt.NDArray[np.uint8] = np.packbits(
+            rng.random(sim_duration) < p, bitorder="little"
+        )
+        self.sim_duration: int = sim_duration
+        self.t: int = 0
+
+    def step(self) -> None:
+        """Outputs the pre-rolled spike of the current timestep."""
+        t: int = self.t
+        if t < self.sim_duration:
+            if (int(self.packed_spikes[t >> 3]) >> (t & 7)) & 1:
+                self.V = self.amplitude
+            else:
+                self.V = 0
+            self.out = self.V
+            self.t = t + 1
+        else:
+            super().step()
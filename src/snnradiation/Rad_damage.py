@@ -1,10 +1,10 @@
 """Contains the radiation settings supported for the SNNs."""
 
 import hashlib
-import json
-from typing import List, Optional, Tuple, Union
+import struct
+from typing import List, Optional, Union
 
-from typeguard import typechecked
+from snnradiation.typechecking import typechecked
 
 
 # pylint: disable=R0903
@@ -14,6 +14,17 @@ class Rad_damage:
     decrease/increase randomly (if they are excited by a incoming
     radiation.)"""
 
+    # Fixed attributes, to keep the instances small and attribute access fast.
+    __slots__ = (
+        "amplitude",
+        "effect_type",
+        "excitatory",
+        "inhibitory",
+        "probability_per_t",
+        "nr_of_synaptic_weight_increases",
+        "_settings_hash",
+    )
+
     @typechecked
     def __init__(
         self,
@@ -28,6 +39,9 @@ class Rad_damage:
         self.effect_type: str = effect_type
         self.excitatory: bool = excitatory
         self.inhibitory: bool = inhibitory
+        # The settings are not changed after initialisation, so their hash is
+        # computed once, on the first call to get_hash.
+        self._settings_hash: Optional[str] = None
         if (
             nr_of_synaptic_weight_increases is None
             and probability_per_t is None
@@ -78,37 +92,68 @@ class Rad_damage:
         ]:
             raise NotImplementedError(f"Error, {effect_type} not implemented.")
 
-    @typechecked
     def get_hash(self) -> str:
-        """Converts radiation settings into a hash."""
-        sorted_rad_settings_list: List[
-            Tuple[str, Union[float, bool, str]]
-        ] = []
-        for sorted_key in sorted(self.__dict__.keys()):
-            # rad_settings_list.append((key, value))
-            sorted_rad_settings_list.append(self.__dict__[sorted_key])
-
-        rad_settings_hash: str = str(
-            hashlib.sha256(
-                json.dumps(sorted_rad_settings_list).encode("utf-8")
-            ).hexdigest()
+        """Converts radiation settings into a hash.
+
+        The settings are fed to the hash as a fixed, canonical byte layout
+        instead of a json string, which avoids building throwaway objects.
+        """
+        if self._settings_hash is not None:
+            return self._settings_hash
+
+        # The settings are packed in a fixed order. The optional settings are
+        # preceded by whether they are None, to keep None distinct from 0.
+        settings_payload: bytes = struct.pack(
+            "<d???d?q",
+            self.amplitude,
+            self.excitatory,
+            self.inhibitory,
+            self.probability_per_t is None,
+            self.probability_per_t or 0.0,
+            self.nr_of_synaptic_weight_increases is None,
+            self.nr_of_synaptic_weight_increases or 0,
         )
-        return rad_settings_hash
+        rad_settings_hash = hashlib.blake2b(digest_size=32)
+        rad_settings_hash.update(self.effect_type.encode("utf-8"))
+        rad_settings_hash.update(settings_payload)
+        self._settings_hash = rad_settings_hash.hexdigest()
+        return self._settings_hash
 
-    @typechecked
     def get_rad_hash(self, neuron_names: List[str], seed: int) -> str:
         """Return a deterministic hash of the radiation based on a list of
         neuron names."""
-        neuron_names.append(self.get_hash())
-        neuron_names.append(str(seed))
-        rad_affected_neurons_hash: str = str(
-            hashlib.sha256(
-                json.dumps(sorted(neuron_names)).encode("utf-8")
-            ).hexdigest()
-        )
-        return rad_affected_neurons_hash
+        rad_affected_neurons_hash = self.get_neuron_names_hasher(neuron_names)
+        rad_affected_neurons_hash.update(str(seed).encode("utf-8"))
+        return rad_affected_neurons_hash.hexdigest()
+
+    def get_rad_hashes(
+        self, neuron_names: List[str], seeds: List[int]
+    ) -> List[str]:
+        """Returns the get_rad_hash output for each seed, for a sweep over
+        seeds. The neuron names are sorted and hashed only once, after which
+        a copy of that hash state is completed for each seed."""
+        neuron_names_hash = self.get_neuron_names_hasher(neuron_names)
+        rad_hashes: List[str] = []
+        for seed in seeds:
+            rad_affected_neurons_hash = neuron_names_hash.copy()
+            rad_affected_neurons_hash.update(str(seed).encode("utf-8"))
+            rad_hashes.append(rad_affected_neurons_hash.hexdigest())
+        return rad_hashes
+
+    def get_neuron_names_hasher(
+        self, neuron_names: List[str]
+    ) -> hashlib.blake2b:
+        """Returns a hash object that contains the sorted neuron names and the
+        radiation settings, to which the seed can still be added."""
+        neuron_names_hash = hashlib.blake2b(digest_size=32)
+        # Separate the names, such that e.g. ["ab", "c"] and ["a", "bc"] do
+        # not yield the same hash. The incoming list is not modified.
+        for neuron_name in sorted(neuron_names):
+            neuron_names_hash.update(neuron_name.encode("utf-8"))
+            neuron_names_hash.update(b"\0")
+        neuron_names_hash.update(self.get_hash().encode("utf-8"))
+        return neuron_names_hash
 
-    @typechecked
     def get_filename(self) -> str:
         """Returns a filename string."""
         return (
@@ -119,8 +164,18 @@ class Rad_damage:
         )
 
 
-def list_of_hashes_to_hash(hashes: List[str]) -> str:
-    """Converts a list of hashes into a new hash."""
-    return str(
-        hashlib.sha256(json.dumps(sorted(hashes)).encode("utf-8")).hexdigest()
+def list_of_hashes_to_hash(
+    hashes: List[str], *, presorted: bool = False
+) -> str:
+    """Converts a list of hashes into a new hash.
+
+    The hashes are sorted first, such that the order of the list does not
+    matter. Callers that already pass the hashes in a deterministic order can
+    set presorted=True to skip that sort.
+    """
+    # Hex hashes are ascii, and are hashed as a single contiguous buffer.
+    encoded_hashes = (some_hash.encode("ascii") for some_hash in hashes)
+    merged_hashes: bytes = b"\0".join(
+        encoded_hashes if presorted else sorted(encoded_hashes)
     )
+    return hashlib.blake2b(merged_hashes, digest_size=32).hexdigest()
@@ -1,5 +1,5 @@
 """Applies the radiation settings to the simsnn."""
-from typing import List, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 
 from simsnn.core.connections import Synapse, Synaptic_rad
@@ -8,9 +8,10 @@ import numpy as np
 from simsnn.core.networks import Network
 from simsnn.core.nodes import LIF, RandomSpiker
 from simsnn.core.simulators import Simulator
-from typeguard import typechecked
 
+from snnradiation.Prerolled_spiker import Prerolled_spiker
 from snnradiation.Rad_damage import Rad_damage
+from snnradiation.typechecking import typechecked
 
 
 @typechecked
@@ -19,6 +20,7 @@ def apply_rad_to_simsnn(
     seed: int,
     snn: Simulator,
     ignored_neuron_names: List[str],
+    est_sim_duration: Optional[int] = None,
 ) -> None:
     """Modifies the snn to ensure the desired radiation effects are simulated.
 
@@ -47,33 +49,39 @@ def apply_rad_to_simsnn(
         - spikes with specified probability (per timestep).
 
     - Random synapse death is not implemented.
+
+    If the est_sim_duration is given, the spikes of the radiation neurons are
+    drawn at once, for that duration, before the simulation starts. The
+    radiation neurons spike the same as without the est_sim_duration.
     """
-    if rad.effect_type in ["change_u", "neuron_death"]:
-        apply_delta_u_rad(
-            rad=rad,
-            seed=seed,
-            snn=snn,
-            ignored_neuron_names=ignored_neuron_names,
-        )
-    elif rad.effect_type == "rand_neuron_spike":
-        apply_rand_spiking_neuron_rad(
-            rad=rad,
-            seed=seed,
-            snn=snn,
-            ignored_neuron_names=ignored_neuron_names,
-        )
-    elif rad.effect_type == "rand_synapse_spike":
-        apply_rand_spiking_synapse_rad(
+    # Radiation that never spikes does not change the behaviour of the snn, so
+    # no neurons or synapses are added for it.
+    if rad.probability_per_t == 0:
+        return
+
+    # Neither does a change in u of 0.
+    if rad.effect_type in ["change_u", "neuron_death"] and rad.amplitude == 0:
+        return
+
+    rad_applier: Optional[Callable[..., None]] = RAD_APPLIERS.get(
+        rad.effect_type
+    )
+    if rad_applier is not None:
+        rad_applier(
             rad=rad,
             seed=seed,
             snn=snn,
             ignored_neuron_names=ignored_neuron_names,
+            est_sim_duration=est_sim_duration,
         )
 
 
-@typechecked
 def apply_delta_u_rad(
-    rad: Rad_damage, seed: int, snn: Simulator, ignored_neuron_names: List[str]
+    rad: Rad_damage,
+    seed: int,
+    snn: Simulator,
+    ignored_neuron_names: List[str],
+    est_sim_duration: Optional[int] = None,
 ) -> None:
     """Modifies the snn to apply a change in neuron currents to model simulated
     radiation effects.
@@ -85,40 +93,46 @@ def apply_delta_u_rad(
         - spikes with specified probability (per timestep)
     """
     net: Network = snn.network
-    new_nodes: List[Tuple[RandomSpiker, LIF]] = []
-
-    # First get the new nodes that need to be added.
-    for i, node in enumerate(snn.network.nodes):
-        if node.name not in ignored_neuron_names:
-            # Create new neuron that randomly spikes.
-            # The amplitude in the rand_spiking node is the voltage spike, not
-            # the output synapse spike.
-            rand_spiking_node = RandomSpiker(
-                p=rad.probability_per_t,
-                amplitude=1,
-                rng=np.random.default_rng(seed=seed + i),
+    target_indices: List[int] = []
+    target_nodes: List[LIF] = []
+    # Use a set for constant time lookups of the ignored neurons.
+    ignored_names: Set[str] = set(ignored_neuron_names)
+    # Read the radiation settings once, instead of in every iteration.
+    amplitude: float = rad.amplitude
+
+    # First get the nodes that receive a new node.
+    for i, node in enumerate(net.nodes):
+        if node.name not in ignored_names:
+            target_indices.append(i)
+            target_nodes.append(node)
+    rand_spiking_nodes: List[RandomSpiker] = create_rand_spiking_nodes(
+        est_sim_duration=est_sim_duration,
+        probability_per_t=rad.probability_per_t,
+        seed=seed,
+        seed_offsets=target_indices,
+    )
+
+    # Add the new nodes. Done after the loop over the nodes to prevent
+    # rand_spiking neurons from getting rand_spiking_neurons.
+    net.nodes.extend(rand_spiking_nodes)
+    # Create new synapse into original neuron.
+    create_rad_synapses(
+        net=net,
+        synapse_specs=[
+            (rand_spiking_node, target_node, amplitude)
+            for rand_spiking_node, target_node in zip(
+                rand_spiking_nodes, target_nodes
             )
-            new_nodes.append((rand_spiking_node, node))
-
-    # Add the new nodes. Done in separate loop to prevent rand_spiking neurons
-    # from getting rand_spiking_neurons.
-    for rand_spiking_node, target_node in new_nodes:
-        net.nodes.append(rand_spiking_node)
-        # Create new synapse into original neuron.
-        net.createSynapse(
-            pre=rand_spiking_node,
-            post=target_node,
-            w=rad.amplitude,
-            d=1,
-        )
+        ],
+    )
 
 
-@typechecked
 def apply_rand_spiking_neuron_rad(
     rad: Rad_damage,
     seed: int,
     snn: Simulator,
     ignored_neuron_names: List[str],
+    est_sim_duration: Optional[int] = None,
 ) -> None:
     """Modifies the snn to apply a random spiking neuron to model simulated
     radiation effects.
@@ -130,41 +144,43 @@ def apply_rand_spiking_neuron_rad(
         - spikes with specified probability (per timestep)
     """
     net: Network = snn.network
-    new_nodes: List[Tuple[RandomSpiker, List[Tuple[LIF, float]]]] = []
-
-    for i, node in enumerate(snn.network.nodes):
-        if node.name not in ignored_neuron_names:
-            # Create new neuron that randomly spikes.
-            # The amplitude in the rand_spiking node is the voltage spike, not
-            # the output synapse spike.
-            rand_spiking_node = RandomSpiker(
-                p=rad.probability_per_t,
-                amplitude=1,
-                rng=np.random.default_rng(seed=seed + i),
-            )
+    target_indices: List[int] = []
+    target_nodes: List[LIF] = []
+    ignored_names: Set[str] = set(ignored_neuron_names)
 
-            # Create new synapses into outgoing neighbours of original neuron.
-            neighbour_synapses: List[Synapse] = []
-            for synapse in net.synapses:
-                if synapse.pre.name == node.name:
-                    neighbour_synapses.append(synapse)
+    synapses_per_pre: Dict[str, List[Synapse]] = get_synapses_per_pre(net=net)
 
-            new_nodes.append((rand_spiking_node, neighbour_synapses))
+    for i, node in enumerate(net.nodes):
+        if node.name not in ignored_names:
+            target_indices.append(i)
+            target_nodes.append(node)
+    rand_spiking_nodes: List[RandomSpiker] = create_rand_spiking_nodes(
+        est_sim_duration=est_sim_duration,
+        probability_per_t=rad.probability_per_t,
+        seed=seed,
+        seed_offsets=target_indices,
+    )
 
-    for rand_spiking_node, synapses in new_nodes:
-        net.nodes.append(rand_spiking_node)
-        for synapse in synapses:
-            net.createSynapse(
-                pre=rand_spiking_node,
-                post=synapse.post,
-                w=synapse.w,
-                d=1,
+    net.nodes.extend(rand_spiking_nodes)
+    # Create new synapses into outgoing neighbours of original neuron.
+    create_rad_synapses(
+        net=net,
+        synapse_specs=[
+            (rand_spiking_node, synapse.post, synapse.w)
+            for rand_spiking_node, target_node in zip(
+                rand_spiking_nodes, target_nodes
             )
+            for synapse in synapses_per_pre.get(target_node.name, [])
+        ],
+    )
 
 
-@typechecked
 def apply_rand_spiking_synapse_rad(
-    rad: Rad_damage, seed: int, snn: Simulator, ignored_neuron_names: List[str]
+    rad: Rad_damage,
+    seed: int,
+    snn: Simulator,
+    ignored_neuron_names: List[str],
+    est_sim_duration: Optional[int] = None,
 ) -> None:
     """Modifies the snn to apply a random spiking synapse to model simulated
     radiation effects.
@@ -176,29 +192,133 @@ def apply_rand_spiking_synapse_rad(
         - spikes with specified probability (per timestep).
     """
     net: Network = snn.network
-    new_synapses: List[Tuple[RandomSpiker, Synapse]] = []
-
-    for i, synapse in enumerate(net.synapses):
-        if synapse.pre.name not in ignored_neuron_names:
-            # Create new neuron that randomly spikes.
-            # The amplitude in the rand_spiking node is the voltage spike, not
-            # the output synapse spike.
-            rand_spiking_node = RandomSpiker(
-                p=rad.probability_per_t,
-                amplitude=1,
-                rng=np.random.default_rng(seed=seed + i),
+    target_indices: List[int] = []
+    target_synapses: List[Tuple[LIF, float]] = []
+    ignored_names: Set[str] = set(ignored_neuron_names)
+
+    # Read the synapse attributes once, so the loop only handles local values.
+    synapse_view: List[Tuple[str, LIF, float]] = [
+        (synapse.pre.name, synapse.post, synapse.w) for synapse in net.synapses
+    ]
+
+    for i, (pre_name, post, weight) in enumerate(synapse_view):
+        if pre_name not in ignored_names:
+            target_indices.append(i)
+            target_synapses.append((post, weight))
+    rand_spiking_nodes: List[RandomSpiker] = create_rand_spiking_nodes(
+        est_sim_duration=est_sim_duration,
+        probability_per_t=rad.probability_per_t,
+        seed=seed,
+        seed_offsets=target_indices,
+    )
+
+    net.nodes.extend(rand_spiking_nodes)
+    # Create new synapse into the target neuron of original synapse.
+    create_rad_synapses(
+        net=net,
+        synapse_specs=[
+            (rand_spiking_node, post, weight)
+            for rand_spiking_node, (post, weight) in zip(
+                rand_spiking_nodes, target_synapses
             )
-            new_synapses.append((rand_spiking_node, synapse))
-
-    for rand_spiking_node, synapse in new_synapses:
-        net.nodes.append(rand_spiking_node)
-        # Create new synapses into outgoing neighbours of original neuron.
-        net.createSynapse(
-            pre=rand_spiking_node,
-            post=synapse.post,
-            w=synapse.w,
-            d=1,
+        ],
+    )
+
+
+# The function that applies each radiation effect type to the snn. The
+# change_synaptic_weight effect is applied with
+# apply_synapse_weight_increase_rad instead.
+RAD_APPLIERS: Dict[str, Callable[..., None]] = {
+    "change_u": apply_delta_u_rad,
+    "neuron_death": apply_delta_u_rad,
+    "rand_neuron_spike": apply_rand_spiking_neuron_rad,
+    "rand_synapse_spike": apply_rand_spiking_synapse_rad,
+}
+
+
+def get_synapses_per_pre(*, net: Network) -> Dict[str, List[Synapse]]:
+    """Returns the outgoing synapses of each neuron, by neuron name.
+
+    The synapses are grouped in a single pass over the synapses, instead of
+    scanning all synapses for each neuron.
+    """
+    synapses_per_pre: Dict[str, List[Synapse]] = {}
+    for synapse in net.synapses:
+        synapses_per_pre.setdefault(synapse.pre.name, []).append(synapse)
+    return synapses_per_pre
+
+
+def create_rand_spiking_nodes(
+    *,
+    est_sim_duration: Optional[int],
+    probability_per_t: Optional[float],
+    seed: int,
+    seed_offsets: List[int],
+) -> List[RandomSpiker]:
+    """Creates a new neuron that randomly spikes, for each seed offset.
+
+    Each new neuron gets its own random generator, with an independent stream
+    that is derived from the seed and its offset. If the est_sim_duration is
+    known, each new neuron draws its spikes for that duration at once from its
+    stream, before the simulation starts. This yields the same spikes as
+    drawing them one timestep at a time.
+    """
+    rngs: List[np.random.Generator] = get_spiker_rngs(
+        seed=seed, seed_offsets=seed_offsets
+    )
+    # The amplitude in the rand_spiking node is the voltage spike, not
+    # the output synapse spike.
+    if est_sim_duration is None:
+        return [
+            RandomSpiker(p=probability_per_t, amplitude=1, rng=rng)
+            for rng in rngs
+        ]
+    if probability_per_t is None:
+        raise ValueError(
+            "Error, pre-rolling the radiation spikes requires a radiation "
+            + "effect probability per timestep."
         )
+    return [
+        Prerolled_spiker(
+            amplitude=1,
+            p=probability_per_t,
+            rng=rng,
+            sim_duration=est_sim_duration,
+        )
+        for rng in rngs
+    ]
+
+
+def get_spiker_rngs(
+    *, seed: int, seed_offsets: List[int]
+) -> List[np.random.Generator]:
+    """Returns a random generator for each seed offset, that yields the child
+    stream of the seed at that offset.
+
+    The child seed sequences are spawned at once from a single parent seed
+    sequence. The children of ignored offsets are spawned as well, such that
+    the stream of a spiker depends only on its offset, and e.g. seed=1 at
+    offset 0 and seed=0 at offset 1 do not share a random stream.
+    """
+    child_seeds: List[np.random.SeedSequence] = np.random.SeedSequence(
+        entropy=seed
+    ).spawn(max(seed_offsets, default=-1) + 1)
+    return [
+        np.random.default_rng(child_seeds[seed_offset])
+        for seed_offset in seed_offsets
+    ]
+
+
+def create_rad_synapses(
+    *,
+    net: Network,
+    synapse_specs: List[Tuple[RandomSpiker, LIF, float]],
+) -> None:
+    """Creates a synapse with a delay of 1 from each radiation neuron into its
+    target neuron, for each (pre, post, weight) specification."""
+    create_synapse = net.createSynapse
+    for pre, post, weight in synapse_specs:
+        create_synapse(pre=pre, post=post, w=weight, d=1)
 
 
 @typechecked
@@ -220,32 +340,33 @@ def apply_synapse_weight_increase_rad(
             "Expected a specification of the nr of synaptic weight increases."
         )
 
+    ignored_names: Set[str] = set(ignored_neuron_names)
+    synapses: List[Synapse] = snn.network.synapses
+
     # Convert the radiation object into a Synaptic_rad object.
     synaptic_rad = Synaptic_rad(
         avg_weight_increase=rad.amplitude,
         est_sim_duration=est_sim_duration,
-        n_synapses=len(snn.network.synapses),
+        n_synapses=len(synapses),
         nswi=rad.nr_of_synaptic_weight_increases,
         probability_per_t=rad.probability_per_t,
         seed=seed,
     )
 
-    for count, synapse in enumerate(snn.network.synapses):
-        if (
-            synapse.pre.name not in ignored_neuron_names
-            and synapse.post.name not in ignored_neuron_names
-        ):
+    for count, synapse in enumerate(synapses):
+        pre, post = synapse.pre, synapse.post
+        if pre.name not in ignored_names and post.name not in ignored_names:
             # Replace the existing synapse with a radiated synapse.
             new_synapse: Synapse = Synapse(
-                pre=synapse.pre,
-                post=synapse.post,
+                pre=pre,
+                post=post,
                 w=synapse.w,
                 d=synapse.d,
                 radiation=synaptic_rad,
             )
             # new_synapse.ID=snn.network.synapses[count].ID
             new_synapse.ID = count
-            snn.network.synapses[count] = new_synapse
+            synapses[count] = new_synapse
 
 def get_and_neuron(*, net: Network) -> LIF:
     """Creates a neuron that spikes if it receives an input of 2."""
@@ -0,0 +1,19 @@
+"""Contains the decorator that performs the runtime type checks.
+
+The runtime type checks are skipped if the SNNRAD_NO_TYPECHECK environment
+variable is set, e.g. for long radiation sweeps or fast test runs.
+"""
+import os
+from typing import Any, Callable, TypeVar
+
+from typeguard import typechecked as typeguard_typechecked
+
+Function = TypeVar("Function", bound=Callable[..., Any])
+
+
+def typechecked(func: Function) -> Function:
+    """Returns the function with runtime type checks, unless the
+    SNNRAD_NO_TYPECHECK environment variable is set when it is decorated."""
+    if os.getenv("SNNRAD_NO_TYPECHECK"):
+        return func
+    return typeguard_typechecked(func)
@@ -0,0 +1,147 @@
+"""Tests whether the radiation neurons and synapses are added to the snn as
+expected."""
+from __future__ import annotations
+
+import unittest
+from typing import List, Optional, Tuple, Type
+
+from simsnn.core.networks import Network
+from simsnn.core.nodes import RandomSpiker
+from simsnn.core.simulators import Simulator
+
+from snnradiation.apply_rad_to_simsnn import RAD_APPLIERS, apply_rad_to_simsnn
+from snnradiation.Prerolled_spiker import Prerolled_spiker
+from snnradiation.Rad_damage import Rad_damage
+from snnradiation.typechecking import typechecked
+
+
+class Test_apply_rad_to_simsnn(unittest.TestCase):
+    """Verifies the radiation neurons and synapses that are added to the snn,
+    with and without pre-rolling the radiation spikes."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+
+    @typechecked
+    def test_prerolled_rad_structure(
+        self,
+    ) -> None:
+        """Tests whether pre-rolling the radiation spikes adds the same
+        neurons and synapses as not pre-rolling them, for each radiation
+        effect type."""
+        for effect_type in RAD_APPLIERS:
+            rad = Rad_damage(
+                amplitude=-2.0,
+                effect_type=effect_type,
+                excitatory=False,
+                inhibitory=True,
+                probability_per_t=0.5,
+            )
+            structures: List[List[Tuple[int, str, float, int]]] = []
+            for est_sim_duration in [None, 5]:
+                snn: Simulator = create_sample_snn()
+                apply_rad_to_simsnn(
+                    rad=rad,
+                    seed=42,
+                    snn=snn,
+                    ignored_neuron_names=["c"],
+                    est_sim_duration=est_sim_duration,
+                )
+                nodes = snn.network.nodes
+                # The original 3 neurons are followed by the radiation
+                # neurons.
+                self.assertGreater(len(nodes), 3)
+                for rad_node in nodes[3:]:
+                    self.assertIs(
+                        type(rad_node),
+                        get_rad_node_type(est_sim_duration=est_sim_duration),
+                    )
+                structures.append(
+                    [
+                        (
+                            nodes.index(synapse.pre),
+                            synapse.post.name,
+                            synapse.w,
+                            synapse.d,
+                        )
+                        for synapse in snn.network.synapses
+                    ]
+                )
+            self.assertEqual(structures[0], structures[1], effect_type)
+
+    @typechecked
+    def test_ineffective_rad_is_skipped(
+        self,
+    ) -> None:
+        """Tests whether radiation that never spikes, or that changes u by 0,
+        leaves the snn unchanged, whereas random spikes with an amplitude of 0
+        are still added to the snn."""
+        for effect_type in RAD_APPLIERS:
+            for amplitude, probability_per_t, is_skipped in [
+                (-2.0, 0.0, True),
+                (0.0, 0.5, effect_type in ["change_u", "neuron_death"]),
+            ]:
+                snn: Simulator = create_sample_snn()
+                original_nodes = list(snn.network.nodes)
+                original_synapses = list(snn.network.synapses)
+                apply_rad_to_simsnn(
+                    rad=Rad_damage(
+                        amplitude=amplitude,
+                        effect_type=effect_type,
+                        excitatory=False,
+                        inhibitory=True,
+                        probability_per_t=probability_per_t,
+                    ),
+                    seed=42,
+                    snn=snn,
+                    ignored_neuron_names=[],
+                )
+                if is_skipped:
+                    self.assertEqual(snn.network.nodes, original_nodes)
+                    self.assertEqual(snn.network.synapses, original_synapses)
+                else:
+                    self.assertGreater(
+                        len(snn.network.nodes), len(original_nodes)
+                    )
+                    self.assertGreater(
+                        len(snn.network.synapses), len(original_synapses)
+                    )
+
+
+def get_rad_node_type(
+    *, est_sim_duration: Optional[int]
+) -> Type[RandomSpiker]:
+    """Returns the type of the radiation neurons that are added to the snn."""
+    if est_sim_duration is None:
+        return RandomSpiker
+    return Prerolled_spiker
+
+
+@typechecked
+def create_sample_snn() -> Simulator:
+    """Creates a simsnn network of 3 neurons a, b and c, with the synapses
+    a-b, a-c and b-c."""
+    net: Network = Network()
+    sim: Simulator = Simulator(net)
+    neurons = {
+        ID: net.createLIF(
+            ID=ID,
+            bias=0,
+            du=1.0,
+            m=1.0,
+            thr=1,
+            V_reset=0,
+        )
+        for ID in ["a", "b", "c"]
+    }
+    for pre, post, weight in [("a", "b", 2), ("a", "c", 3), ("b", "c", 4)]:
+        net.createSynapse(
+            pre=neurons[pre],
+            post=neurons[post],
+            ID=f"{pre}-{post}",
+            w=weight,
+            d=1,
+        )
+    return sim
@@ -0,0 +1,107 @@
+"""Tests whether the pre-rolled spikers output their pre-rolled spikes."""
+from __future__ import annotations
+
+import unittest
+from typing import List
+
+import numpy as np
+from simsnn.core.nodes import RandomSpiker
+
+from snnradiation.apply_rad_to_simsnn import get_spiker_rngs
+from snnradiation.Prerolled_spiker import Prerolled_spiker
+from snnradiation.typechecking import typechecked
+
+
+class Test_prerolled_spiker(unittest.TestCase):
+    """Verifies the pre-rolled spikers are deterministic, and output their
+    spikes in the order in which they are drawn."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+
+    @typechecked
+    def test_spikes_are_output_in_order(
+        self,
+    ) -> None:
+        """Tests whether each spiker outputs the spikes of the stream of its
+        own seed offset, and whether the same seed yields the same spikes."""
+        sim_duration: int = 10
+        seed_offsets: List[int] = [0, 2, 5]
+        spikers = create_spikers(
+            seed=42, seed_offsets=seed_offsets, sim_duration=sim_duration
+        )
+        same_seed_spikers = create_spikers(
+            seed=42, seed_offsets=seed_offsets, sim_duration=sim_duration
+        )
+        for seed_offset, spiker, same_seed_spiker in zip(
+            seed_offsets, spikers, same_seed_spikers
+        ):
+            # Draw the expected spikes independently of the spiker.
+            expected_spikes = (
+                np.random.default_rng(
+                    np.random.SeedSequence(
+                        entropy=42, spawn_key=(seed_offset,)
+                    )
+                ).random(sim_duration)
+                < 0.5
+            )
+            np.testing.assert_array_equal(
+                spiker.packed_spikes, same_seed_spiker.packed_spikes
+            )
+            for t in range(sim_duration):
+                spiker.step()
+                self.assertEqual(spiker.out, int(expected_spikes[t]))
+
+    @typechecked
+    def test_spikes_equal_random_spiker(
+        self,
+    ) -> None:
+        """Tests whether a spiker outputs the same spikes as a RandomSpiker
+        with the same random generator, both during and after its pre-rolled
+        spikes."""
+        spiker = Prerolled_spiker(
+            amplitude=1,
+            p=0.5,
+            rng=np.random.default_rng(seed=42),
+            sim_duration=10,
+        )
+        random_spiker = RandomSpiker(
+            p=0.5, amplitude=1, rng=np.random.default_rng(seed=42)
+        )
+        for _ in range(25):
+            spiker.step()
+            random_spiker.step()
+            self.assertEqual(spiker.out, random_spiker.out)
+
+    @typechecked
+    def test_spikes_continue_after_sim_duration(
+        self,
+    ) -> None:
+        """Tests whether a spiker keeps spiking after its pre-rolled spikes
+        are used up."""
+        spiker = Prerolled_spiker(
+            amplitude=1,
+            p=1.0,
+            rng=np.random.default_rng(seed=42),
+            sim_duration=2,
+        )
+        for _ in range(4):
+            spiker.step()
+            self.assertEqual(spiker.out, 1)
+
+
+def create_spikers(
+    *, seed: int, seed_offsets: List[int], sim_duration: int
+) -> List[Prerolled_spiker]:
+    """Creates a spiker for each seed offset, like the radiation spikers."""
+    return [
+        Prerolled_spiker(
+            amplitude=1,
+            p=0.5,
+            rng=rng,
+            sim_duration=sim_duration,
+        )
+        for rng in get_spiker_rngs(seed=seed, seed_offsets=seed_offsets)
+    ]
@@ -0,0 +1,139 @@
+"""Tests whether the radiation hashes are deterministic."""
+from __future__ import annotations
+
+import unittest
+from typing import Any, Dict
+
+from snnradiation.Rad_damage import Rad_damage
+from snnradiation.typechecking import typechecked
+
+
+class Test_rad_hash(unittest.TestCase):
+    """Verifies the radiation hash depends on the neuron names and seed, and
+    does not modify its input."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.rad = Rad_damage(
+            amplitude=-10.0,
+            effect_type="change_u",
+            excitatory=False,
+            inhibitory=True,
+            probability_per_t=0.1,
+        )
+
+    @typechecked
+    def test_rad_hash_does_not_modify_neuron_names(
+        self,
+    ) -> None:
+        """Tests whether repeated calls yield the same hash and leave the
+        list of neuron names unchanged."""
+        neuron_names = ["spike_once_0", "selector_1", "degree_receiver_0"]
+        first_hash: str = self.rad.get_rad_hash(neuron_names, seed=42)
+        second_hash: str = self.rad.get_rad_hash(neuron_names, seed=42)
+        self.assertEqual(first_hash, second_hash)
+        self.assertEqual(
+            neuron_names, ["spike_once_0", "selector_1", "degree_receiver_0"]
+        )
+
+    @typechecked
+    def test_rad_hash_is_order_independent(
+        self,
+    ) -> None:
+        """Tests whether the hash ignores the order of the neuron names, but
+        does depend on the seed."""
+        self.assertEqual(
+            self.rad.get_rad_hash(["a", "b"], seed=1),
+            self.rad.get_rad_hash(["b", "a"], seed=1),
+        )
+        self.assertNotEqual(
+            self.rad.get_rad_hash(["a", "b"], seed=1),
+            self.rad.get_rad_hash(["a", "b"], seed=2),
+        )
+        self.assertNotEqual(
+            self.rad.get_rad_hash(["ab", "c"], seed=1),
+            self.rad.get_rad_hash(["a", "bc"], seed=1),
+        )
+
+    @typechecked
+    def test_rad_hashes_match_rad_hash(
+        self,
+    ) -> None:
+        """Tests whether the hashes of a sweep over seeds equal the hashes that
+        are computed per seed."""
+        neuron_names = ["spike_once_0", "selector_1", "degree_receiver_0"]
+        seeds = [0, 1, 7, 42]
+        self.assertEqual(
+            self.rad.get_rad_hashes(neuron_names, seeds),
+            [self.rad.get_rad_hash(neuron_names, seed) for seed in seeds],
+        )
+
+    @typechecked
+    def test_settings_hash_keeps_none_distinct_from_0(
+        self,
+    ) -> None:
+        """Tests whether a probability of 0 and a nr of synaptic weight
+        increases of 0 yield different settings hashes."""
+        probability_rad = Rad_damage(
+            amplitude=-10.0,
+            effect_type="change_u",
+            excitatory=False,
+            inhibitory=True,
+            probability_per_t=0.0,
+        )
+        nr_of_increases_rad = Rad_damage(
+            amplitude=-10.0,
+            effect_type="change_u",
+            excitatory=False,
+            inhibitory=True,
+            nr_of_synaptic_weight_increases=0,
+        )
+        self.assertNotEqual(
+            probability_rad.get_hash(), nr_of_increases_rad.get_hash()
+        )
+
+    @typechecked
+    def test_settings_hash_depends_on_each_setting(
+        self,
+    ) -> None:
+        """Tests whether changing any of the radiation settings changes the
+        settings hash."""
+        for changed_setting in [
+            {"amplitude": 10.0},
+            {"effect_type": "neuron_death"},
+            {"excitatory": True},
+            {"inhibitory": False},
+        ]:
+            settings: Dict[str, Any] = {
+                "amplitude": -10.0,
+                "effect_type": "change_u",
+                "excitatory": False,
+                "inhibitory": True,
+                "probability_per_t": 0.1,
+            }
+            settings.update(changed_setting)
+            self.assertNotEqual(
+                Rad_damage(**settings).get_hash(),
+                self.rad.get_hash(),
+                changed_setting,
+            )
+
+    @typechecked
+    def test_settings_hash_is_cached(
+        self,
+    ) -> None:
+        """Tests whether the settings hash is stored on the first call, and
+        returned unchanged on the second call."""
+        rad = Rad_damage(
+            amplitude=-10.0,
+            effect_type="change_u",
+            excitatory=False,
+            inhibitory=True,
+            probability_per_t=0.1,
+        )
+        first_hash: str = rad.get_hash()
+        # pylint: disable=W0212
+        self.assertEqual(rad._settings_hash, first_hash)
+        self.assertEqual(rad.get_hash(), first_hash)
@@ -4,12 +4,13 @@ from __future__ import annotations
 import itertools
 import unittest
 
+import numpy as np
 from simsnn.core.networks import Network
 from simsnn.core.nodes import LIF
 from simsnn.core.simulators import Simulator
-from typeguard import typechecked
 
 from snnradiation.apply_rad_to_simsnn import get_and_neuron
+from snnradiation.typechecking import typechecked
 
 
 class Test_and_neuron(unittest.TestCase):
@@ -88,22 +89,16 @@ class Test_and_neuron(unittest.TestCase):
             left_train=left_train,
             right_train=right_train,
         )
-        for t in range(0, sim_duration):
-            testnet.run(
-                1, extend_multimeter=True, extend_raster=True
-            )  # Initialise default 2 neuron test net.
-
-            # Assert the output neuron spikes on timestep after
-            # the input neurons spike simultaneously.
-            and_neuron_id: int = 2
-            print(
-                f"t={t}, expected={expected[t+1]}, "
-                + f"{testnet.network.nodes[and_neuron_id].__dict__}"
+        # Run the whole simulation at once, and verify the recorded spikes.
+        testnet.run(sim_duration, extend_multimeter=True, extend_raster=True)
+
+        # Assert the output neuron spikes on timestep after
+        # the input neurons spike simultaneously.
+        and_neuron_id: int = 2
+        for t in range(2, sim_duration):
+            self.assertEqual(
+                testnet.raster.spikes[t][and_neuron_id], expected[t]
             )
-            if t > 1:
-                self.assertEqual(
-                    testnet.network.nodes[and_neuron_id].out, expected[t]
-                )
 
     @typechecked
     def test_nominal_and_neuron_behaviour(
@@ -118,39 +113,40 @@ class Test_and_neuron(unittest.TestCase):
 
         # pylint: disable=R1702
         for sim_duration in range(2, 9):
-            left_arrs: list = list(
-                itertools.product([True, False], repeat=sim_duration)
+            # Each row is one of the possible spike trains of sim_duration
+            # timesteps, used for both the left and the right input neuron.
+            spike_trains: np.ndarray = np.array(
+                list(itertools.product([True, False], repeat=sim_duration))
             )
-            right_arrs: list = list(
-                itertools.product([True, False], repeat=sim_duration)
-            )
-            for left_str in left_arrs:
-                for right_str in right_arrs:
+            # The and neuron spikes one timestep after both input neurons
+            # spike, for each combination of left and right spike train.
+            expected_spikes: np.ndarray = np.logical_and(
+                spike_trains[:, np.newaxis, :], spike_trains[np.newaxis, :, :]
+            ).astype(int)
+
+            for left_id, left_train in enumerate(spike_trains):
+                for right_id, right_train in enumerate(spike_trains):
                     # Create simsnn network of 2 neurons.
                     testnet: Simulator = create_sample_network_with_and_neuron(
-                        left_train=[*left_str],
-                        right_train=[*right_str],
+                        left_train=left_train.tolist(),
+                        right_train=right_train.tolist(),
+                    )
+
+                    # Run the whole simulation at once, and verify the
+                    # recorded spikes of the and neuron.
+                    testnet.run(
+                        sim_duration,
+                        extend_multimeter=True,
+                        extend_raster=True,
                     )
 
-                    for t in range(0, sim_duration):
-                        testnet.run(
-                            1, extend_multimeter=True, extend_raster=True
-                        )  # Initialise default 2 neuron test net.
-
-                        # Assert the output neuron spikes on timestep after
-                        # the input neurons spike simultaneously.
-                        and_neuron_id: int = 2
-                        if t > 0:
-                            if [*left_str][t - 1] == 1 and [*right_str][
-                                t - 1
-                            ] == 1:
-                                self.assertEqual(
-                                    testnet.network.nodes[and_neuron_id].out, 1
-                                )
-                            else:
-                                self.assertEqual(
-                                    testnet.network.nodes[and_neuron_id].out, 0
-                                )
+                    # Assert the output neuron spikes on timestep after
+                    # the input neurons spike simultaneously.
+                    and_neuron_id: int = 2
+                    np.testing.assert_array_equal(
+                        np.asarray(testnet.raster.spikes)[1:, and_neuron_id],
+                        expected_spikes[left_id, right_id, :-1],
+                    )
 
 
 def create_sample_network_with_and_neuron(
@@ -2,15 +2,17 @@
 networkx simulation."""
 from __future__ import annotations
 
+import os
 import unittest
 
 import numpy as np
 from simsnn.core.networks import Network
-from simsnn.core.nodes import LIF, RandomSpiker
+from simsnn.core.nodes import LIF
 from simsnn.core.simulators import Simulator
-from typeguard import typechecked
 
 from snnradiation.apply_rad_to_simsnn import get_and_neuron
+from snnradiation.Prerolled_spiker import Prerolled_spiker
+from snnradiation.typechecking import typechecked
 
 
 class Test_synapse_excitation(unittest.TestCase):
@@ -45,31 +47,24 @@ class Test_synapse_excitation(unittest.TestCase):
 
         # Add raster and multimeter to monitor spike behaviour.
 
-        for target_index, target_neuron in enumerate(testnet.raster.targets):
-            for t in range(0, sim_duration):
-                print(
-                    f"{t},{target_neuron.ID}  V="
-                    + f"{testnet.multimeter.V[t][target_index]} : "
-                    + f"{testnet.raster.spikes[t][target_index]}"
-                )
+        print_neuron_states(sim_duration=sim_duration, testnet=testnet)
+
+        spikes: np.ndarray = np.asarray(testnet.raster.spikes)
+        voltages: np.ndarray = np.asarray(testnet.multimeter.V)
 
         # Assert the input neuron spikes once at t=1.
         input_node_id: int = 0
-        self.assertFalse(testnet.raster.spikes[0][input_node_id])
-        self.assertTrue(testnet.raster.spikes[1][input_node_id])
-        self.assertFalse(testnet.raster.spikes[2][input_node_id])
-        self.assertFalse(testnet.raster.spikes[3][input_node_id])
-        self.assertFalse(testnet.raster.spikes[4][input_node_id])
+        np.testing.assert_array_equal(
+            spikes[:, input_node_id], [False, True, False, False, False]
+        )
 
         # Assert the output neuron voltage is 0 until the input spike comes
         # in at t=2 (on timestep after the neuron spiked at t=1) and than stays
         # constant at V=3
         output_node_id: int = 1
-        self.assertEqual(testnet.multimeter.V[0][output_node_id], 0)
-        self.assertEqual(testnet.multimeter.V[1][output_node_id], 0)
-        self.assertEqual(testnet.multimeter.V[2][output_node_id], 3)
-        self.assertEqual(testnet.multimeter.V[3][output_node_id], 3)
-        self.assertEqual(testnet.multimeter.V[4][output_node_id], 3)
+        np.testing.assert_array_equal(
+            voltages[:, output_node_id], [0, 0, 3, 3, 3]
+        )
 
     @typechecked
     def test_radiated_synapse_behaviour(
@@ -84,11 +79,13 @@ class Test_synapse_excitation(unittest.TestCase):
         """
         # Create simsnn network of 2 neurons.
         testnet: Simulator = create_sample_network_of_2_neurons()
+        sim_duration: int = 5
 
         add_simulated_random_synapse_excitation(
             left_neuron=testnet.network.nodes[0],
             right_neuron=testnet.network.nodes[1],
             sim=testnet,
+            sim_duration=sim_duration,
             probability=0.99999,
             seed=1,
         )
@@ -100,57 +97,61 @@ class Test_synapse_excitation(unittest.TestCase):
         for i, node in enumerate(testnet.network.nodes):
             print(f"{i}:{node.ID}")
 
-        sim_duration: int = 5
         testnet.run(sim_duration)  # Initialise default 2 neuron test net.
 
-        for target_index, target_neuron in enumerate(testnet.raster.targets):
-            for t in range(0, sim_duration):
-                print(
-                    f"{t},{target_neuron.ID}  V="
-                    + f"{testnet.multimeter.V[t][target_index]} : "
-                    + f"{testnet.raster.spikes[t][target_index]}"
-                )
+        print_neuron_states(sim_duration=sim_duration, testnet=testnet)
+
+        spikes: np.ndarray = np.asarray(testnet.raster.spikes)
+        voltages: np.ndarray = np.asarray(testnet.multimeter.V)
 
         # Assert the input neuron spikes once at for all timesteps.
         input_node_id: int = 0
-        self.assertFalse(testnet.raster.spikes[0][input_node_id])
-        self.assertTrue(testnet.raster.spikes[1][input_node_id])
-        self.assertFalse(testnet.raster.spikes[2][input_node_id])
-        self.assertFalse(testnet.raster.spikes[3][input_node_id])
-        self.assertFalse(testnet.raster.spikes[4][input_node_id])
+        np.testing.assert_array_equal(
+            spikes[:, input_node_id], [False, True, False, False, False]
+        )
 
         # Assert the RandomSpiker neuron spikes once at for all timesteps.
         random_spiker_node_id: int = 2
-        self.assertTrue(testnet.raster.spikes[0][random_spiker_node_id])
-        self.assertTrue(testnet.raster.spikes[1][random_spiker_node_id])
-        self.assertTrue(testnet.raster.spikes[2][random_spiker_node_id])
-        self.assertTrue(testnet.raster.spikes[3][random_spiker_node_id])
-        self.assertTrue(testnet.raster.spikes[4][random_spiker_node_id])
+        np.testing.assert_array_equal(
+            spikes[:, random_spiker_node_id], [True, True, True, True, True]
+        )
 
         # Assert the and neuron spikes at t=1.
         and_neuron_id: int = 3
-        self.assertFalse(testnet.raster.spikes[0][and_neuron_id])
-        self.assertFalse(testnet.raster.spikes[1][and_neuron_id])
-        self.assertTrue(testnet.raster.spikes[2][and_neuron_id])
-        self.assertFalse(testnet.raster.spikes[3][and_neuron_id])
-        self.assertFalse(testnet.raster.spikes[4][and_neuron_id])
+        np.testing.assert_array_equal(
+            spikes[:, and_neuron_id], [False, False, True, False, False]
+        )
 
         # Assert the output neuron voltage is 0 until the input spike comes
         # in at t=2 (on timestep after the neuron spiked at t=1) and than stays
         # constant at V=3 +1 because of the and neuron input.
         output_node_id: int = 1
-        self.assertEqual(testnet.multimeter.V[0][output_node_id], 0)
-        self.assertEqual(testnet.multimeter.V[1][output_node_id], 0)
-        self.assertEqual(testnet.multimeter.V[2][output_node_id], 3)
-        self.assertEqual(testnet.multimeter.V[3][output_node_id], 4)
-        self.assertEqual(testnet.multimeter.V[4][output_node_id], 4)
+        np.testing.assert_array_equal(
+            voltages[:, output_node_id], [0, 0, 3, 4, 4]
+        )
+
 
+def print_neuron_states(*, sim_duration: int, testnet: Simulator) -> None:
+    """Prints the voltage and spikes of each neuron at each timestep, if the
+    SNNRAD_TRACE environment variable is set."""
+    if not os.environ.get("SNNRAD_TRACE"):
+        return
+    for target_index, target_neuron in enumerate(testnet.raster.targets):
+        for t in range(0, sim_duration):
+            print(
+                f"{t},{target_neuron.ID}  V="
+                f"{testnet.multimeter.V[t][target_index]} : "
+                f"{testnet.raster.spikes[t][target_index]}"
+            )
 
+
+# pylint: disable=R0913
 # @typechecked
 def add_simulated_random_synapse_excitation(
     *,
     left_neuron: LIF,
     sim: Simulator,
+    sim_duration: int,
     probability: float,
     right_neuron: LIF,
     seed: int,
@@ -158,6 +159,7 @@ def add_simulated_random_synapse_excitation(
     """Includes two neurons:
 
      0. random_spiker neuron - spikes randomly with probability: probability.
+     Its spikes for the sim_duration are drawn before the simulation starts.
      1. synapse_excitation neuron - spikes if it receives an input from the
      random_spiker neuron and from the input neuron.
     The delay between input and synapse is 0, and the delay between synapse
@@ -168,11 +170,12 @@ def add_simulated_random_synapse_excitation(
     # Create new neuron that randomly spikes.
     # The amplitude in the rand_spiking node is the voltage spike, not
     # the output synapse spike.
-    rand_spiking_node = RandomSpiker(
+    rand_spiking_node: Prerolled_spiker = Prerolled_spiker(
         ID="randomspiker",
-        p=probability,
         amplitude=1,
+        p=probability,
         rng=np.random.default_rng(seed=seed),
+        sim_duration=sim_duration,
     )
     net.nodes.append(rand_spiking_node)
 